@@ -75,10 +75,16 @@ def main(argv=None):
             "code_quality": 0.15,
         }
 
-        results = []
+        # Build every line's metrics first, so the size lookups can be batched
+        jobs = []
         for line in lines:
             code_url, dataset_url, model_url = line
 
+            # Only lines with a model url are processed
+            if not model_url:
+                print(f"Skipping line (no model url): {lines}", file=sys.stderr)
+                continue
+
             metrics = [
                 RampUpTimeMetric(model_url),
                 BusFactorMetric(code_url, model_url),
@@ -89,21 +95,22 @@ def main(argv=None):
                 DatasetQualityMetric(dataset_url),
                 CodeQualityMetric(code_url, model_url),
             ]
+            jobs.append((model_url, metrics))
 
-            output_str = ""
-            # If line contains a model url, process it
-            if model_url:
-                start = time.time()
-                with mp.Pool(processes=min(len(metrics), mp.cpu_count())) as pool:
-                    metrics = pool.map(run_metric, metrics)
-                net_latency = int((time.time() - start) * 1000)
-
-                output_str = build_output(
-                    model_url, metrics, weights, net_latency)
-                results.append(output_str)
-            if not model_url:
-                print(f"Skipping line (no model url): {lines}", file=sys.stderr)
-                continue
+        # One concurrent pass over the Hugging Face API for all parameter counts
+        SizeMetric.get_data_batch(
+            [m for _, metrics in jobs for m in metrics if isinstance(m, SizeMetric)])
+
+        results = []
+        for model_url, metrics in jobs:
+            start = time.time()
+            with mp.Pool(processes=min(len(metrics), mp.cpu_count())) as pool:
+                metrics = pool.map(run_metric, metrics)
+            net_latency = int((time.time() - start) * 1000)
+
+            output_str = build_output(
+                model_url, metrics, weights, net_latency)
+            results.append(output_str)
 
         for r in results:
             print(r)
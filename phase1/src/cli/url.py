@@ -2,22 +2,41 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Tuple, Type
 
+try:
+    # The URL patterns need no backtracking, so RE2's DFA matcher handles them all
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
 
-@dataclass
+
+# slots=True: URLs are built in bulk by classify_url, so skip the per-instance __dict__
+@dataclass(slots=True)
 class URL(ABC):
     raw: str
     url_type: str
     author: Optional[str] = None
     name: Optional[str] = None
+    # Set from the single match done at construction; validate() just reports it
+    _valid: bool = field(default=False, repr=False, compare=False)
+
+    URL_TYPE = ""
 
     @abstractmethod
     def validate(self) -> bool:
         """Return True if the URL is valid for this type."""
         pass
 
+    @classmethod
+    def from_match(cls, raw: str, author: Optional[str], name: Optional[str]) -> URL:
+        """Build a valid URL from parts classify_url already parsed, skipping the re-match."""
+        url = cls.__new__(cls)
+        URL.__init__(url, raw, cls.URL_TYPE, author, name, True)
+        return url
+
     def display_name(self) -> str:
         return f"{self.author}/{self.name}" if self.author and self.name else self.raw
 
@@ -28,98 +47,156 @@ class URL(ABC):
 # Matches either:
 #   https://huggingface.co/<author>/<model>
 #   https://huggingface.co/<model>
-HF_MODEL_PATTERN = re.compile(
-    r"^https?://huggingface\.co/(?:(?P<author>[^/]+)/)?(?P<name>[^/]+)"
+HF_MODEL_PATTERN = regex_engine.compile(
+    r"\Ahttps?://huggingface\.co/(?:(?P<author>[^/]+)/)?(?P<name>[^/]+)"
 )
 
 
 class ModelURL(URL):
+    __slots__ = ()
+    URL_TYPE = "model"
+
     def __init__(self, raw: str):
-        super().__init__(raw, "model")
+        super().__init__(raw, self.URL_TYPE)
         m = HF_MODEL_PATTERN.match(raw)
         if m:
             # if no explicit author, default to "huggingface"
             self.author = m.group("author") or "huggingface"
             self.name = m.group("name")
+            self._valid = True
 
     def validate(self) -> bool:
-        return bool(HF_MODEL_PATTERN.match(self.raw))
+        return self._valid
 
 
 # -----------------
 # Dataset URLs
 # -----------------
-HF_DATASET_PATTERN = re.compile(
-    r"^https?://huggingface\.co/datasets/([^/]+)/([^/]+)"
+HF_DATASET_PATTERN = regex_engine.compile(
+    r"\Ahttps?://huggingface\.co/datasets/([^/]+)/([^/]+)"
 )
-IMAGENET_PATTERN = re.compile(r"^https?://www\.image-net\.org/data/.*")
+_IMAGENET_PREFIXES = ("http://www.image-net.org/data/", "https://www.image-net.org/data/")
 
 
 class DatasetURL(URL):
+    __slots__ = ()
+    URL_TYPE = "dataset"
+
     def __init__(self, raw: str):
-        super().__init__(raw, "dataset")
+        super().__init__(raw, self.URL_TYPE)
         m = HF_DATASET_PATTERN.match(raw)
         if m:
             self.author = m.group(1)
             self.name = m.group(2)
-        elif IMAGENET_PATTERN.match(raw):
+            self._valid = True
+        elif raw.startswith(_IMAGENET_PREFIXES):
             # ImageNet doesn’t use the same style, but keep fields consistent
             self.author = "imagenet"
             self.name = "imagenet"
+            self._valid = True
 
     def validate(self) -> bool:
-        return bool(
-            HF_DATASET_PATTERN.match(self.raw) or IMAGENET_PATTERN.match(self.raw)
-        )
+        return self._valid
 
 
 # -----------------
 # Code URLs
 # -----------------
-GITHUB_PATTERN = re.compile(r"^https?://github\.com/([^/]+)/([^/]+)")
-GITLAB_PATTERN = re.compile(r"^https?://gitlab\.com/([^/]+)/([^/]+)")
-HF_SPACES_PATTERN = re.compile(
-    r"^https?://huggingface\.co/spaces/([^/]+)/([^/]+)"
+GITHUB_PATTERN = regex_engine.compile(r"\Ahttps?://github\.com/([^/]+)/([^/]+)")
+GITLAB_PATTERN = regex_engine.compile(r"\Ahttps?://gitlab\.com/([^/]+)/([^/]+)")
+HF_SPACES_PATTERN = regex_engine.compile(
+    r"\Ahttps?://huggingface\.co/spaces/([^/]+)/([^/]+)"
 )
+CODE_PATTERNS = (GITHUB_PATTERN, GITLAB_PATTERN, HF_SPACES_PATTERN)
 
 
 class CodeURL(URL):
+    __slots__ = ()
+    URL_TYPE = "code"
+
     def __init__(self, raw: str):
-        super().__init__(raw, "code")
-        for pattern in [GITHUB_PATTERN, GITLAB_PATTERN, HF_SPACES_PATTERN]:
+        super().__init__(raw, self.URL_TYPE)
+        for pattern in CODE_PATTERNS:
             m = pattern.match(raw)
             if m:
                 self.author = m.group(1)
                 self.name = m.group(2)
+                self._valid = True
                 break
 
     def validate(self) -> bool:
-        return bool(
-            GITHUB_PATTERN.match(self.raw)
-            or GITLAB_PATTERN.match(self.raw)
-            or HF_SPACES_PATTERN.match(self.raw)
-        )
+        return self._valid
 
 
 # -----------------
 # Dispatcher
 # -----------------
-def classify_url(raw: str) -> Optional[URL]:
-    # 1. Hugging Face datasets (or ImageNet)
-    if HF_DATASET_PATTERN.match(raw) or IMAGENET_PATTERN.match(raw):
-        return DatasetURL(raw)
-
-    # 2. Code hosting (GitHub, GitLab, Hugging Face Spaces)
-    if (
-        GITHUB_PATTERN.match(raw)
-        or GITLAB_PATTERN.match(raw)
-        or HF_SPACES_PATTERN.match(raw)
-    ):
-        return CodeURL(raw)
-
-    # 3. Hugging Face models
-    if HF_MODEL_PATTERN.match(raw):
-        return ModelURL(raw)
-
-    # 4. Anything else → unsupported
+# (URL class, author, name) for a classified URL
+_Parts = Tuple[Type[URL], str, str]
+
+
+def _author_and_name(path: str) -> Optional[Tuple[str, str]]:
+    """The first two path segments, if both are non-empty."""
+    parts = path.split("/", 2)
+    if len(parts) >= 2 and parts[0] and parts[1]:
+        return parts[0], parts[1]
     return None
+
+
+def _classify_hf(path: str) -> Optional[_Parts]:
+    # Datasets and Spaces first; anything else on the host is a model
+    for prefix, cls in (("datasets/", DatasetURL), ("spaces/", CodeURL)):
+        if path.startswith(prefix):
+            found = _author_and_name(path[len(prefix):])
+            if found:
+                return cls, found[0], found[1]
+    found = _author_and_name(path)
+    if found:
+        return ModelURL, found[0], found[1]
+    # Bare huggingface.co/<model> URLs default the author, as ModelURL does
+    name = path.split("/", 1)[0]
+    return (ModelURL, "huggingface", name) if name else None
+
+
+def _classify_code(path: str) -> Optional[_Parts]:
+    found = _author_and_name(path)
+    return (CodeURL, found[0], found[1]) if found else None
+
+
+def _classify_imagenet(path: str) -> Optional[_Parts]:
+    return (DatasetURL, "imagenet", "imagenet") if path.startswith("data/") else None
+
+
+# Host -> handler for the path after it; mirrors the per-class patterns above
+_HOST_DISPATCH = {
+    "huggingface.co": _classify_hf,
+    "github.com": _classify_code,
+    "gitlab.com": _classify_code,
+    "www.image-net.org": _classify_imagenet,
+}
+
+
+@lru_cache(maxsize=4096)
+def _classify_parts(raw: str) -> Optional[_Parts]:
+    """Parse a URL into its class and fields; cached, as batches repeat the same URLs."""
+    if raw.startswith("https://"):
+        rest = raw[8:]
+    elif raw.startswith("http://"):
+        rest = raw[7:]
+    else:
+        return None
+    host, sep, path = rest.partition("/")
+    handler = _HOST_DISPATCH.get(host)
+    if handler is None or not sep:
+        # Anything else → unsupported
+        return None
+    return handler(path)
+
+
+def classify_url(raw: str) -> Optional[URL]:
+    # Only the immutable parse is cached; callers still get their own URL object
+    parts = _classify_parts(raw)
+    if parts is None:
+        return None
+    cls, author, name = parts
+    return cls.from_match(raw, author, name)
@@ -18,7 +18,11 @@ Score:
 NOTES: potentially upgrade in future to infer number of parameters from model name or use parse README with AI
 """
 
-from typing import Dict, Optional, Any
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 from huggingface_hub import HfApi
 
@@ -26,98 +30,117 @@ from src.cli.url import ModelURL
 from src.metrics.metric import Metric
 
 
+# Concurrent model_info requests in get_data_batch; kept modest for HF rate limits
+BATCH_FETCH_CONCURRENCY = 32
+
+
+@lru_cache(maxsize=1)
+def _hf_api() -> HfApi:
+    """Shared client, built on first lookup rather than at import."""
+    return HfApi()
+
+
+@lru_cache(maxsize=1024)
+def get_param_count(repo_id: str) -> Optional[int]:
+    """
+    Total parameter count from model_info.safetensors, or None if not published.
+    Cached per repo so repeated scoring of a model costs one API call; failed
+    lookups raise and are retried next time.
+    """
+    info = _hf_api().model_info(repo_id)
+    if info.safetensors and "total" in info.safetensors:
+        return info.safetensors.get("total")
+    return None
+
+
 class SizeMetric(Metric):
     def __init__(self, model_url: ModelURL):
         super().__init__("size_score")
         self.model_url = model_url
+        # Milliseconds spent fetching data in get_data_batch, added to .latency by run()
+        self.fetch_latency = 0
 
     def get_data(self) -> Dict[str, Optional[int]]:
         """
         Gets number of parameters from model_info.safetensors or cardData "params".
         """
-        api = HfApi()
-        info = api.model_info(f"{self.model_url.author}/{self.model_url.name}")
-
-        if info.safetensors and "total" in info.safetensors:
-            return {"size": info.safetensors.get("total")}
+        return {"size": get_param_count(f"{self.model_url.author}/{self.model_url.name}")}
 
-        return {"size": None}
-
-    def calculate_score(self) -> Dict[str, float]:
+    @classmethod
+    def get_data_batch(cls, metrics: List["SizeMetric"]) -> None:
         """
-        Calculate the size score based on parameter count.
-        Returns a dictionary mapping hardware targets to normalized scores.
+        Fetch data for many SizeMetrics at once, overlapping the API round-trips.
+        A repo whose lookup fails gets size None, which scores 0 like a failed run().
         """
-        # Ensure self.data exists and contains "size"
-        params: Optional[int] = None
+        repo_ids = [f"{m.model_url.author}/{m.model_url.name}" for m in metrics]
+        unique = list(dict.fromkeys(repo_ids))
+        if not unique:
+            return
+
+        def fetch(repo_id: str) -> Tuple[Optional[int], int]:
+            start = time.time()
+            try:
+                count = get_param_count(repo_id)
+            except Exception:
+                count = None
+            return count, int((time.time() - start) * 1000)
+
+        with ThreadPoolExecutor(max_workers=min(BATCH_FETCH_CONCURRENCY, len(unique))) as pool:
+            fetched = dict(zip(unique, pool.map(fetch, unique)))
+        for metric, repo_id in zip(metrics, repo_ids):
+            count, metric.fetch_latency = fetched[repo_id]
+            metric.set_data({"size": count})
+
+    def run(self) -> None:
+        super().run()
+        # Data fetched by get_data_batch is part of this metric's cost too
+        self.latency = (self.latency or 0) + self.fetch_latency
+
+    def _param_count(self) -> Optional[int]:
         if self.data is not None:
             raw_size: Any = self.data.get("size")
             if isinstance(raw_size, int):
-                params = raw_size
+                return raw_size
+        return None
 
+    def calculate_score(self) -> Dict[str, float]:
+        """
+        Calculate the size score based on parameter count.
+        Returns a dictionary mapping hardware targets to normalized scores.
+        """
+        # One read of self.data["size"]; missing or zero scores 0 everywhere
+        params = self._param_count()
         if not params:
-            return {
-                "raspberry_pi": 0.0,
-                "jetson_nano": 0.0,
-                "desktop_pc": 0.0,
-                "aws_server": 0.0,
-            }
+            return {device: 0.0 for device in DEVICE_THRESHOLDS}
+        return {device: score(device, params) for device in DEVICE_THRESHOLDS}
+
+
+# Upper bounds (inclusive) on parameter count for each score band, per device.
+# A count at or below thresholds[i] scores SCORE_BANDS[i]; above them all scores 0.0.
+SCORE_BANDS = (1.0, 0.8, 0.5, 0.2, 0.0)
+DEVICE_THRESHOLDS = {
+    "raspberry_pi": (50e6, 100e6, 200e6, 500e6),
+    "jetson_nano": (100e6, 300e6, 500e6, 1e9),
+    "desktop_pc": (3e9, 7e9, 13e9, 30e9),
+    "aws_server": (10e9, 30e9, 70e9, 200e9),
+}
 
-        return {
-            "raspberry_pi": score_raspberry_pi(params),
-            "jetson_nano": score_jetson_nano(params),
-            "desktop_pc": score_desktop_pc(params),
-            "aws_server": score_aws_server(params),
-        }
+def score(device: str, params: int) -> float:
+    # bisect_left counts thresholds strictly below params, matching the <= bands
+    return SCORE_BANDS[bisect_left(DEVICE_THRESHOLDS[device], params)]
 
 
 def score_raspberry_pi(params: int) -> float:
-    if params <= 50e6:
-        return 1.0
-    elif params <= 100e6:
-        return 0.8
-    elif params <= 200e6:
-        return 0.5
-    elif params <= 500e6:
-        return 0.2
-    else:
-        return 0.0
+    return score("raspberry_pi", params)
 
 
 def score_jetson_nano(params: int) -> float:
-    if params <= 100e6:
-        return 1.0
-    elif params <= 300e6:
-        return 0.8
-    elif params <= 500e6:
-        return 0.5
-    elif params <= 1e9:
-        return 0.2
-    else:
-        return 0.0
+    return score("jetson_nano", params)
 
 
 def score_desktop_pc(params: int) -> float:
-    if params <= 3e9:
-        return 1.0
-    elif params <= 7e9:
-        return 0.8
-    elif params <= 13e9:
-        return 0.5
-    elif params <= 30e9:
-        return 0.2
-    else:
-        return 0.0
+    return score("desktop_pc", params)
 
 
 def score_aws_server(params: int) -> float:
-    if params <= 10e9:
-        return 1.0
-    elif params <= 30e9:
-        return 0.8
-    elif params <= 70e9:
-        return 0.5
-    elif params <= 200e9:
-        return 0.2
-    else:
-        return 0.0
+    return score("aws_server", params)
@@ -7,10 +7,21 @@ Tests cover:
 -
 """
 
+import time
+
 import pytest
 
 from src.cli.url import ModelURL
-from src.metrics.size import SizeMetric
+from src.metrics.size import DEVICE_THRESHOLDS, SCORE_BANDS, SizeMetric, get_param_count
+
+
+@pytest.fixture(autouse=True)
+def clear_param_count_cache():
+    # get_param_count memoizes per repo; keep lookups from leaking across tests
+    get_param_count.cache_clear()
+    yield
+    get_param_count.cache_clear()
+
 
 # Dummy empty url to pass into test cases in which we just set the data manually
 dummy_url = ModelURL(
@@ -66,3 +77,76 @@ def test_none_size():
     scores = metric.score
     assert isinstance(scores, dict)
     assert all(v == 0 for v in scores.values())
+
+
+# Every band edge, one past it, and one short of it, plus values outside all bands
+EDGE_SIZES = sorted({
+    int(t) + delta
+    for thresholds in DEVICE_THRESHOLDS.values()
+    for t in thresholds
+    for delta in (-1, 0, 1)
+} | {1, 10**12})
+
+
+def test_calculate_score_at_band_edges():
+    for size in EDGE_SIZES:
+        metric = SizeMetric(dummy_url)
+        metric.set_data({"size": size})
+        metric.run()
+        for device, thresholds in DEVICE_THRESHOLDS.items():
+            # Reference: the first band whose (inclusive) upper bound holds size
+            expected = next(
+                (band for band, t in zip(SCORE_BANDS, thresholds) if size <= t), 0.0)
+            assert metric.score[device] == expected, (device, size)
+
+
+def test_get_data_batch_populates_all_and_survives_failures(monkeypatch):
+    counts = {"a/small": 10, "b/large": 10**11, "c/unpublished": None}
+    calls = []
+
+    def fake_param_count(repo_id):
+        calls.append(repo_id)
+        if repo_id == "d/broken":
+            raise RuntimeError("HF API down")
+        return counts[repo_id]
+
+    monkeypatch.setattr("src.metrics.size.get_param_count", fake_param_count)
+    repo_ids = ["a/small", "d/broken", "b/large", "c/unpublished", "a/small"]
+    metrics = [SizeMetric(ModelURL(raw=f"https://huggingface.co/{r}")) for r in repo_ids]
+
+    SizeMetric.get_data_batch(metrics)
+
+    assert [m.data for m in metrics] == [
+        {"size": 10}, {"size": None}, {"size": 10**11}, {"size": None}, {"size": 10},
+    ]
+    assert sorted(calls) == ["a/small", "b/large", "c/unpublished", "d/broken"]
+
+
+def test_run_after_get_data_batch_counts_fetch_latency(monkeypatch):
+    def slow_param_count(repo_id):
+        time.sleep(0.05)
+        return 10
+
+    monkeypatch.setattr("src.metrics.size.get_param_count", slow_param_count)
+    metric = SizeMetric(ModelURL(raw="https://huggingface.co/a/small"))
+
+    SizeMetric.get_data_batch([metric])
+    metric.run()
+
+    assert metric.fetch_latency >= 50
+    assert metric.latency >= metric.fetch_latency
+
+
+def test_get_param_count_is_cached_per_repo(monkeypatch):
+    class FakeApi:
+        calls = 0
+
+        def model_info(self, repo_id):
+            FakeApi.calls += 1
+            return type("Info", (), {"safetensors": {"total": 42}})()
+
+    monkeypatch.setattr("src.metrics.size._hf_api", FakeApi)
+
+    assert get_param_count("a/model") == 42
+    assert get_param_count("a/model") == 42
+    assert FakeApi.calls == 1
@@ -0,0 +1 @@
+# Phase 2 Package
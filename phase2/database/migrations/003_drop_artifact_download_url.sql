@@ -0,0 +1,13 @@
+-- ============================================
+-- Migration: Drop artifacts.download_url
+-- ============================================
+-- The API now derives download_url from the artifact id (legacy
+-- POST /packages rows keep their /packages/<id> form), so the stored
+-- column is never read or written. Older databases created from the
+-- ORM models still carry it; schema.sql never did.
+
+BEGIN;
+
+ALTER TABLE artifacts DROP COLUMN IF EXISTS download_url;
+
+COMMIT;
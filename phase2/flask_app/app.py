@@ -1,4 +1,6 @@
+import hashlib
 import os
+import threading
 from functools import wraps
 
 from flask import Flask, render_template, request, redirect, url_for, session, flash
@@ -6,6 +8,7 @@ import requests
 import sqlite3
 from werkzeug.security import generate_password_hash, check_password_hash
 from dotenv import load_dotenv
+from cachetools import TTLCache
 
 # Load .env if present
 load_dotenv()
@@ -26,6 +29,17 @@ JWT_API_URL = os.environ.get("JWT_API_URL", "http://localhost:5001")
 JWT_VERIFY_PATH = os.environ.get("JWT_VERIFY_PATH", "/auth/me")
 
 
+# Successful verify responses, keyed by a token digest, so each page view doesn't
+# cost a round-trip to the auth API. Kept short so revocations take effect quickly.
+VERIFY_CACHE_TTL_SECONDS = int(os.environ.get("VERIFY_CACHE_TTL_SECONDS", "30"))
+_verify_cache = TTLCache(maxsize=10_000, ttl=VERIFY_CACHE_TTL_SECONDS)
+_verify_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
 def api_url(path: str) -> str:
     return JWT_API_URL.rstrip("/") + path
 
@@ -81,13 +95,23 @@ def verify_token() -> dict | None:
         return None
     
     # Handle JWT tokens from external API
+    cache_key = _token_cache_key(token)
+    with _verify_cache_lock:
+        user = _verify_cache.get(cache_key)
+    if user is not None:
+        return user
+
     headers = get_auth_headers()
     if not headers:
         return None
     try:
         resp = requests.get(api_url(JWT_VERIFY_PATH), headers=headers, timeout=5)
         if resp.status_code == 200:
-            return resp.json()
+            user = resp.json()
+            # Failures are never cached, so a rejected token is re-checked next time
+            with _verify_cache_lock:
+                _verify_cache[cache_key] = user
+            return user
     except requests.RequestException:
         pass
     return None
@@ -295,7 +319,10 @@ def register():
 
 @app.route("/logout")
 def logout():
-    session.pop("token", None)
+    token = session.pop("token", None)
+    if token:
+        with _verify_cache_lock:
+            _verify_cache.pop(_token_cache_key(token), None)
     flash("Logged out.", "info")
     return redirect(url_for("index"))
 
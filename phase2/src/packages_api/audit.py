@@ -4,6 +4,7 @@ Simple, non-blocking implementation that won't break existing functionality.
 """
 from datetime import datetime
 from typing import Any, Dict, List, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from .database import AuditLog
@@ -30,16 +31,39 @@ def record_audit(
         success: Whether action succeeded
         metadata: Additional context (e.g., version, file size)
     """
+    record_audit_bulk(db, [{
+        "action": action,
+        "user_id": user_id,
+        "resource": resource,
+        "resource_type": resource_type,
+        "success": success,
+        "metadata": metadata,
+    }])
+
+
+def record_audit_bulk(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Record many audit log entries in one INSERT. Non-blocking like record_audit.
+    
+    Args:
+        db: Database session
+        rows: One dict per entry, keyed like record_audit's arguments;
+            only 'action' is required
+    """
+    if not rows:
+        return
     try:
-        entry = AuditLog(
-            action=action,
-            user_id=user_id,
-            resource=resource,
-            resource_type=resource_type,
-            success=success,
-            metadata_json=metadata or {},
-        )
-        db.add(entry)
+        db.execute(insert(AuditLog), [
+            {
+                "action": row["action"],
+                "user_id": row.get("user_id"),
+                "resource": row.get("resource"),
+                "resource_type": row.get("resource_type"),
+                "success": row.get("success", True),
+                "metadata_json": row.get("metadata") or {},
+            }
+            for row in rows
+        ])
         db.commit()
     except Exception as e:
         # Don't let audit logging break the main operation
@@ -2,9 +2,10 @@
 Audit log API endpoints.
 Admin-only access to query and export audit logs.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+import msgspec
 from sqlalchemy.orm import Session
 
 from .database import get_db
@@ -13,15 +14,54 @@ from .audit import query_audit_logs
 try:
     from ..logs_api import require_admin
 except ImportError:
-    # Fallback for testing - create a dummy require_admin
-    def require_admin():
-        pass
+    try:
+        # packages_api imported as a top-level package (phase2/src on sys.path)
+        from logs_api import require_admin
+    except ImportError:
+        # Fallback for testing - create a dummy require_admin
+        def require_admin():
+            pass
 
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
 
-@router.get("/logs", response_model=List[AuditLogOut], dependencies=[Depends(require_admin)])
+class AuditLogRow(msgspec.Struct):
+    """Encoding-only mirror of AuditLogOut; the Pydantic model stays for the OpenAPI schema."""
+    id: int
+    action: str
+    user_id: Optional[str]
+    resource: Optional[str]
+    resource_type: Optional[str]
+    success: bool
+    metadata_json: Optional[Dict[str, Any]]
+    created_at: datetime
+
+
+_AUDIT_LOG_ENCODER = msgspec.json.Encoder()
+
+
+def _audit_log_out(log) -> AuditLogRow:
+    return AuditLogRow(
+        id=log.id,
+        action=log.action,
+        user_id=log.user_id,
+        resource=log.resource,
+        resource_type=log.resource_type,
+        success=log.success,
+        metadata_json=log.metadata_json,
+        created_at=log.created_at,
+    )
+
+
+# The body is encoded straight to JSON bytes, skipping response_model validation
+# and jsonable_encoder; the schema is still documented via responses
+@router.get(
+    "/logs",
+    response_model=None,
+    responses={200: {"model": List[AuditLogOut]}},
+    dependencies=[Depends(require_admin)],
+)
 def get_audit_logs(
     start: Optional[datetime] = Query(None, description="Start timestamp"),
     end: Optional[datetime] = Query(None, description="End timestamp"),
@@ -35,7 +75,7 @@ def get_audit_logs(
     
     Returns list of audit log entries, newest first.
     """
-    return query_audit_logs(
+    logs = query_audit_logs(
         db=db,
         start=start,
         end=end,
@@ -43,3 +83,8 @@ def get_audit_logs(
         action=action,
         limit=limit,
     )
+    # msgspec writes UTC timestamps with the same "Z" suffix Pydantic used
+    return Response(
+        _AUDIT_LOG_ENCODER.encode([_audit_log_out(log) for log in logs]),
+        media_type="application/json",
+    )
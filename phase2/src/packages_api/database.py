@@ -1,11 +1,18 @@
 import os
 import sys
 import re
+from functools import lru_cache
 from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, JSON, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import StaticPool, NullPool
 from sqlalchemy.sql import func
 
+try:
+    # RE2 matches in linear time and refuses backtracking-only constructs outright
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
 Base = declarative_base()
 
 # Get DATABASE_URL from environment, default to SQLite for tests
@@ -44,7 +51,26 @@ if DATABASE_URL.startswith("sqlite"):
             poolclass=NullPool,
         )
 else:
-    engine = create_engine(DATABASE_URL)
+    # Each uvicorn worker keeps its own pool; size it for concurrent requests plus
+    # background threads, and recycle/ping so RDS idle disconnects don't surface as errors
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+        pool_recycle=1800,
+        pool_pre_ping=True,
+    )
+
+# Longest prefix of a name/readme that regex search looks at; bounds worst-case match time
+MAX_REGEX_HAYSTACK = 1000
+
+
+@lru_cache(maxsize=256)
+def _compile_regexp(expr):
+    """Compile a REGEXP pattern once; SQLite calls the shim once per row."""
+    # Inline (?i) is understood by both re and RE2
+    return regex_engine.compile("(?i)" + expr)
+
 
 # Register REGEXP function for SQLite
 @event.listens_for(engine, "connect")
@@ -56,11 +82,11 @@ def connect(dbapi_connection, connection_record):
             try:
                 # Limit text length to prevent ReDoS/performance issues
                 # 1000 chars is enough for most names/readmes while preventing deep backtracking
-                if isinstance(item, str) and len(item) > 1000:
-                    item = item[:1000]
+                if isinstance(item, str) and len(item) > MAX_REGEX_HAYSTACK:
+                    item = item[:MAX_REGEX_HAYSTACK]
                 
-                reg = re.compile(expr)
-                return reg.search(item) is not None
+                # Case-insensitive to match PostgreSQL's ~* used by the API
+                return _compile_regexp(expr).search(item) is not None
             except Exception:
                 return False
         
@@ -68,7 +94,9 @@ def connect(dbapi_connection, connection_record):
         if hasattr(dbapi_connection, "create_function"):
             dbapi_connection.create_function("REGEXP", 2, regexp)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: handlers read the committed row straight back into the
+# response, which would otherwise cost a re-SELECT per attribute access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def get_db():
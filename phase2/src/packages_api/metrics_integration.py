@@ -10,8 +10,9 @@ structured rating data for artifacts.
 
 import sys
 import os
-from typing import Dict, Any, Optional
-import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Type
 
 # Add phase1 to path so we can import its modules
 phase1_path = os.path.join(os.path.dirname(__file__), '../../..', 'phase1')
@@ -25,12 +26,34 @@ from src.metrics.dataset_quality import DatasetQualityMetric
 from src.metrics.performance_claims import PerformanceClaimsMetric
 from src.metrics.ramp_up_time import RampUpTimeMetric
 from src.metrics.size import SizeMetric
-from src.cli.url import CodeURL, DatasetURL, ModelURL
+from src.cli.url import URL, CodeURL, DatasetURL, ModelURL
 from src.metrics.metric import Metric
 
 
+# Metrics spend their time waiting on GitHub/Hugging Face/LLM HTTP calls, so
+# threads give the same overlap as processes without the spawn and pickling.
+# Shared across calls; sized for a couple of concurrent ratings of 7 metrics.
+_METRIC_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="metric")
+
+
+@lru_cache(maxsize=1024)
+def _parse_url_parts(url_cls: Type[URL], raw: str) -> Optional[Tuple[str, str]]:
+    """(author, name) of a valid URL, None if invalid; cached per distinct URL."""
+    url = url_cls(raw)
+    return (url.author, url.name) if url.validate() else None
+
+
+def _parse_url(url_cls: Type[URL], raw: str) -> URL:
+    # Only the immutable parse is shared; each rating gets its own URL object,
+    # as metrics running on the thread pool may mutate it
+    parts = _parse_url_parts(url_cls, raw)
+    if parts is None:
+        return url_cls(raw)
+    return url_cls.from_match(raw, *parts)
+
+
 def run_metric(metric: Metric) -> Metric:
-    """Helper function to run a metric (for multiprocessing pool)."""
+    """Helper function to run a metric (for the metric thread pool)."""
     metric.run()
     return metric
 
@@ -73,9 +96,9 @@ class MetricsIntegration:
         
         try:
             # Parse URLs
-            model = ModelURL(model_url)
-            code = CodeURL(code_url) if code_url else None
-            dataset = DatasetURL(dataset_url) if dataset_url else None
+            model = _parse_url(ModelURL, model_url)
+            code = _parse_url(CodeURL, code_url) if code_url else None
+            dataset = _parse_url(DatasetURL, dataset_url) if dataset_url else None
             
             # Initialize metrics
             metrics = [
@@ -89,8 +112,7 @@ class MetricsIntegration:
             ]
             
             # Run metrics in parallel
-            with mp.Pool(processes=min(len(metrics), mp.cpu_count())) as pool:
-                metrics = pool.map(run_metric, metrics)
+            metrics = list(_METRIC_EXECUTOR.map(run_metric, metrics))
             
             # Aggregate scores
             rating = MetricsIntegration._build_rating(metrics, weights)
@@ -3,23 +3,75 @@ Sensitive Model Monitoring Service
 Executes Node.js security scripts before artifact downloads
 """
 
+import shutil
 import subprocess
 import time
-import json
 import os
 from typing import Dict, Optional, Tuple
 from pathlib import Path
 
+import orjson
+from sqlalchemy import text
+
 # Security script configuration
 SECURITY_SCRIPTS_DIR = Path(__file__).parent.parent.parent / "security-scripts"
 DEFAULT_SCRIPT = "default-check.js"
 SCRIPT_TIMEOUT_SECONDS = 5
+# Resolved once instead of searching PATH on every spawn; falls back to the
+# bare name so a missing install still surfaces as FileNotFoundError below
+NODE_EXECUTABLE = shutil.which("node") or "node"
 MAX_OUTPUT_LENGTH = 10000
 
+# Statements are built once so SQLAlchemy's compiled-statement cache can reuse them
+_MONITORING_INSERT = text("""
+    INSERT INTO monitoring_history (
+        artifact_id,
+        script_name,
+        execution_duration_ms,
+        user_id,
+        user_is_admin,
+        exit_code,
+        stdout,
+        stderr,
+        action_taken,
+        metadata
+    ) VALUES (
+        :artifact_id,
+        :script_name,
+        :duration_ms,
+        :user_id,
+        :user_is_admin,
+        :exit_code,
+        :stdout,
+        :stderr,
+        :action_taken,
+        :metadata::jsonb
+    )
+    RETURNING id
+""")
+
+_PACKAGE_SENSITIVITY_QUERY = text("""
+    SELECT is_sensitive, monitoring_script
+    FROM packages
+    WHERE id = :artifact_id
+""")
+
+_ARTIFACT_SENSITIVITY_QUERY = text("""
+    SELECT is_sensitive, monitoring_script
+    FROM artifacts
+    WHERE id = :artifact_id
+""")
+
+
+# Exit codes that let the download proceed; anything else is blocked
+_ACTION_BY_EXIT = {0: "allowed", 1: "warned"}
+
 
 class MonitoringResult:
     """Container for monitoring execution results"""
     
+    __slots__ = ("exit_code", "stdout", "stderr", "duration_ms", "timed_out", "error")
+    
     def __init__(
         self,
         exit_code: int,
@@ -39,18 +91,13 @@ class MonitoringResult:
     def is_allowed(self) -> bool:
         """Determine if download should be allowed based on exit code"""
         # Exit code 0 = safe, 1 = warning (allow), 2+ = block
-        return self.exit_code in [0, 1]
+        return self.exit_code in _ACTION_BY_EXIT
     
     def get_action(self) -> str:
         """Get action taken based on exit code"""
         if self.error or self.timed_out:
             return "error"
-        elif self.exit_code == 0:
-            return "allowed"
-        elif self.exit_code == 1:
-            return "warned"
-        else:
-            return "blocked"
+        return _ACTION_BY_EXIT.get(self.exit_code, "blocked")
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for API response"""
@@ -98,7 +145,7 @@ def run_security_check(
     
     # Build command
     cmd = [
-        "node",
+        NODE_EXECUTABLE,
         str(script_path),
         "--artifact-id", str(artifact_id),
         "--name", artifact_name
@@ -108,7 +155,7 @@ def run_security_check(
         cmd.extend(["--type", artifact_type])
     
     # Execute script
-    start_time = time.time()
+    start_time = time.monotonic()
     timed_out = False
     
     try:
@@ -120,7 +167,7 @@ def run_security_check(
             cwd=str(SECURITY_SCRIPTS_DIR)
         )
         
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
         
         return MonitoringResult(
             exit_code=result.returncode,
@@ -131,7 +178,7 @@ def run_security_check(
         )
         
     except subprocess.TimeoutExpired as e:
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
         timed_out = True
         
         return MonitoringResult(
@@ -153,7 +200,7 @@ def run_security_check(
         )
         
     except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
         
         return MonitoringResult(
             exit_code=255,
@@ -188,35 +235,6 @@ def save_monitoring_result(
     Returns:
         ID of created monitoring_history record
     """
-    from sqlalchemy import text
-    
-    query = text("""
-        INSERT INTO monitoring_history (
-            artifact_id,
-            script_name,
-            execution_duration_ms,
-            user_id,
-            user_is_admin,
-            exit_code,
-            stdout,
-            stderr,
-            action_taken,
-            metadata
-        ) VALUES (
-            :artifact_id,
-            :script_name,
-            :duration_ms,
-            :user_id,
-            :user_is_admin,
-            :exit_code,
-            :stdout,
-            :stderr,
-            :action_taken,
-            :metadata::jsonb
-        )
-        RETURNING id
-    """)
-    
     params = {
         "artifact_id": artifact_id,
         "script_name": script_name,
@@ -227,10 +245,10 @@ def save_monitoring_result(
         "stdout": result.stdout,
         "stderr": result.stderr,
         "action_taken": result.get_action(),
-        "metadata": json.dumps(metadata or {})
+        "metadata": orjson.dumps(metadata or {}, option=orjson.OPT_NON_STR_KEYS).decode()
     }
     
-    result_proxy = db.execute(query, params)
+    result_proxy = db.execute(_MONITORING_INSERT, params)
     db.commit()
     
     row = result_proxy.fetchone()
@@ -248,30 +266,16 @@ def check_artifact_sensitivity(db, artifact_id: str) -> Tuple[bool, Optional[str
     Returns:
         Tuple of (is_sensitive, monitoring_script_name)
     """
-    from sqlalchemy import text
-    
     # Try packages table first (used by main API)
-    query = text("""
-        SELECT is_sensitive, monitoring_script
-        FROM packages
-        WHERE id = :artifact_id
-    """)
-    
     try:
-        result = db.execute(query, {"artifact_id": int(artifact_id)}).fetchone()
+        result = db.execute(_PACKAGE_SENSITIVITY_QUERY, {"artifact_id": int(artifact_id)}).fetchone()
         if result:
             return result[0], result[1] if result[0] else None
     except (ValueError, Exception):
         pass
     
     # Fallback to artifacts table (for future use)
-    query = text("""
-        SELECT is_sensitive, monitoring_script
-        FROM artifacts
-        WHERE id = :artifact_id
-    """)
-    
-    result = db.execute(query, {"artifact_id": artifact_id}).fetchone()
+    result = db.execute(_ARTIFACT_SENSITIVITY_QUERY, {"artifact_id": artifact_id}).fetchone()
     
     if not result:
         return False, None
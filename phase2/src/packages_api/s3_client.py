@@ -1,11 +1,26 @@
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, BinaryIO
 import boto3
+from boto3.s3.transfer import TransferConfig
 from pathlib import Path
 
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 S3_BUCKET = os.getenv("S3_BUCKET_NAME", "my-bucket")
 S3_LOCAL_DIR = os.getenv("S3_LOCAL_DIR")
+# S3 requires every multipart part except the last to be at least 5 MiB
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+# Concurrent DeleteObjects requests when clearing a prefix
+DELETE_CONCURRENCY = 16
+# upload_fileobj splits anything past one chunk into parts sent by a thread pool,
+# so reading the source overlaps with network I/O for large packages
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+    max_concurrency=8,
+    use_threads=True,
+)
 
 
 class S3Client:
@@ -33,7 +48,9 @@ class S3Client:
                 f.write(data)
             return f"file://{p}"
 
-        self.client.upload_fileobj(fileobj, S3_BUCKET, key, ExtraArgs=extra_args or {})
+        self.client.upload_fileobj(
+            fileobj, S3_BUCKET, key, ExtraArgs=extra_args or {}, Config=TRANSFER_CONFIG
+        )
         return f"s3://{S3_BUCKET}/{key}"
 
     def download_stream(self, key: str):
@@ -59,35 +76,53 @@ class S3Client:
 
     def delete_prefix(self, prefix: str):
         if self.local_dir:
-            base = self.local_dir / S3_BUCKET
-            for p in base.rglob("*"):
-                rel = p.relative_to(base)
-                if str(rel).startswith(prefix):
+            # Keys starting with "a/b/c" are exactly the entries of a/b whose name
+            # starts with "c" (and everything below them), so only that one
+            # directory is scanned and matching subtrees are removed wholesale.
+            parent, _, name_prefix = prefix.rpartition("/")
+            parent_dir = self.local_dir / S3_BUCKET / parent
+            try:
+                entries = list(os.scandir(parent_dir))
+            except (FileNotFoundError, NotADirectoryError):
+                return
+            for entry in entries:
+                if not entry.name.startswith(name_prefix):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
                     try:
-                        p.unlink()
+                        os.unlink(entry.path)
                     except FileNotFoundError:
                         pass
             return
 
+        # list_objects_v2 pages hold at most 1000 keys, which is exactly the
+        # DeleteObjects limit, so each page is handed to a worker as it arrives
+        # and its delete overlaps with listing the next page. boto3 clients are
+        # thread-safe, so the workers share self.client.
         paginator = self.client.get_paginator("list_objects_v2")
-        delete_keys = []
-        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix):
-            for obj in page.get("Contents", []):
-                delete_keys.append({"Key": obj["Key"]})
-        if not delete_keys:
-            return
-        for i in range(0, len(delete_keys), 1000):
-            chunk = delete_keys[i: i + 1000]
-            self.client.delete_objects(Bucket=S3_BUCKET, Delete={"Objects": chunk})
+        with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as pool:
+            futures = []
+            for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix):
+                delete_keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+                if delete_keys:
+                    futures.append(pool.submit(
+                        self.client.delete_objects,
+                        Bucket=S3_BUCKET,
+                        Delete={"Objects": delete_keys, "Quiet": True},
+                    ))
+            for future in futures:
+                future.result()
 
     @staticmethod
     def key_from_uri(uri: str) -> str:
-        if uri.startswith("s3://"):
-            parts = uri.split("/", 3)
-            if len(parts) >= 4:
-                return parts[3]
-            if len(parts) == 3:
-                return parts[2]
-        if uri.startswith("file://"):
-            return uri[len("file://"):]
+        scheme, sep, rest = uri.partition("://")
+        if sep:
+            if scheme == "s3":
+                # s3://bucket/key -> key; a bare s3://bucket yields the bucket
+                bucket, slash, key = rest.partition("/")
+                return key if slash else bucket
+            if scheme == "file":
+                return rest
         return uri
@@ -1,17 +1,43 @@
 """
 Pytest configuration and shared fixtures for all tests
 """
+import functools
 import os
 import sys
 import pytest
 import subprocess
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 
-# Add phase2/src to Python path for imports
-PHASE2_SRC = Path(__file__).parent.parent / "phase2" / "src"
-sys.path.insert(0, str(PHASE2_SRC))
+PHASE2_SRC = (Path(__file__).parent.parent / "phase2" / "src").resolve()
+
+# Shared pooled session for server health checks, so fixtures reuse connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Health probe results by URL, so each endpoint is probed at most once per session
+_HEALTH_CHECKS = {}
+
+
+def _is_healthy(url):
+    """True if url answers 200; cached for the rest of the session"""
+    if url not in _HEALTH_CHECKS:
+        try:
+            _HEALTH_CHECKS[url] = _SESSION.get(url, timeout=2).status_code == 200
+        except requests.exceptions.RequestException:
+            _HEALTH_CHECKS[url] = False
+    return _HEALTH_CHECKS[url]
+
+
+def pytest_configure(config):
+    """Add phase2/src to Python path for imports, once per session"""
+    path = str(PHASE2_SRC)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    # Registered by pytest-xdist when installed; declare it so plain runs don't warn
+    config.addinivalue_line("markers", "xdist_group(name): run marked tests on one xdist worker")
 
 
 @pytest.fixture(scope="session")
@@ -42,14 +68,10 @@ def typescript_server(typescript_server_url):
     Assumes server is already running or will be started externally
     """
     # Check if server is already running
-    try:
-        response = requests.get(f"{typescript_server_url}/health", timeout=2)
-        if response.status_code == 200:
-            yield typescript_server_url
-            return
-    except requests.exceptions.RequestException:
-        pass
-    
+    if _is_healthy(f"{typescript_server_url}/health"):
+        yield typescript_server_url
+        return
+
     # If not running, skip tests that need it
     pytest.skip("TypeScript server not running. Start with: npm start")
 
@@ -61,19 +83,26 @@ def fastapi_server(fastapi_server_url, database_url):
     Assumes server is already running or will be started externally
     """
     # Check if server is already running
-    try:
-        response = requests.get(f"{fastapi_server_url}/docs", timeout=2)
-        if response.status_code == 200:
-            yield fastapi_server_url
-            return
-    except requests.exceptions.RequestException:
-        pass
-    
+    if _is_healthy(f"{fastapi_server_url}/docs"):
+        yield fastapi_server_url
+        return
+
     # If not running, skip tests that need it
     pytest.skip("FastAPI server not running. Start with: uvicorn main:app")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def http():
+    """Keep-alive requests session shared by the HTTP API tests"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
 def auth_headers():
     """
     Authentication headers for API requests
@@ -84,24 +113,58 @@ def auth_headers():
     }
 
 
+@pytest.fixture(scope="session")
+def json_auth_headers(auth_headers):
+    """Authentication headers for requests with a JSON body, merged once"""
+    return {**auth_headers, "Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=4)
+def _sessionmaker_for(database_url):
+    """One engine (and its connection pool) per URL, shared by every test"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine(database_url, pool_pre_ping=True)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
 @pytest.fixture
 def db_session(database_url):
     """
     Database session for direct DB tests
     """
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-    
-    engine = create_engine(database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
-    session = SessionLocal()
+    session = _sessionmaker_for(database_url)()
     try:
         yield session
     finally:
         session.close()
 
 
+@pytest.fixture(scope="session")
+def created_artifact_ids(database_url):
+    """
+    Collects ids of artifacts created by tests; all are deleted in one
+    statement at the end of the session
+    """
+    from sqlalchemy import bindparam, text
+
+    ids = []
+    yield ids
+    if ids:
+        session = _sessionmaker_for(database_url)()
+        try:
+            session.execute(
+                text("DELETE FROM artifacts WHERE id IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                {"ids": ids},
+            )
+            session.commit()
+        finally:
+            session.close()
+
+
 @pytest.fixture
 def clean_monitoring_history(db_session):
     """
@@ -124,9 +187,8 @@ def sample_packages(db_session):
     """
     from sqlalchemy import text
     
-    # Clean existing test packages
+    # Clean existing test packages; committed together with the inserts below
     db_session.execute(text("DELETE FROM packages WHERE name LIKE 'test-%'"))
-    db_session.commit()
     
     # Insert test packages
     packages = [
@@ -135,20 +197,23 @@ def sample_packages(db_session):
         ("test-normal-code", "code", False, None),
     ]
     
-    for name, type_, is_sensitive, script in packages:
-        db_session.execute(text("""
-            INSERT INTO packages (name, type, s3_uri, is_sensitive, monitoring_script)
-            VALUES (:name, :type, :s3_uri, :is_sensitive, :script)
-            ON CONFLICT (name) DO UPDATE 
-            SET is_sensitive = EXCLUDED.is_sensitive,
-                monitoring_script = EXCLUDED.monitoring_script
-        """), {
+    # One executemany instead of a statement per row
+    db_session.execute(text("""
+        INSERT INTO packages (name, type, s3_uri, is_sensitive, monitoring_script)
+        VALUES (:name, :type, :s3_uri, :is_sensitive, :script)
+        ON CONFLICT (name) DO UPDATE 
+        SET is_sensitive = EXCLUDED.is_sensitive,
+            monitoring_script = EXCLUDED.monitoring_script
+    """), [
+        {
             "name": name,
             "type": type_,
             "s3_uri": f"s3://bucket/{name}.zip",
             "is_sensitive": is_sensitive,
             "script": script
-        })
+        }
+        for name, type_, is_sensitive, script in packages
+    ])
     
     db_session.commit()
     
@@ -159,48 +224,81 @@ def sample_packages(db_session):
     db_session.commit()
 
 
-@pytest.fixture
-def sample_artifacts(db_session):
-    """
-    Create sample artifacts for TypeScript API testing
-    """
+# Suffix for sample artifact ids; each xdist worker seeds and deletes only its own rows
+RUN_ID = os.environ.get("PYTEST_XDIST_WORKER", str(os.getpid()))
+
+# Canonical rows for TypeScript API testing: (id, name, type, url, readme)
+SAMPLE_ARTIFACTS = [
+    (f"test-bert-1-{RUN_ID}", "test-bert-model", "model", "https://example.com/bert.zip", "BERT base model for NLP"),
+    (f"test-gpt-2-{RUN_ID}", "test-gpt-model", "model", "https://example.com/gpt.zip", "GPT model for text generation"),
+    (f"test-imagenet-3-{RUN_ID}", "test-dataset-imagenet", "dataset", "https://example.com/imagenet.zip", "ImageNet dataset"),
+    (f"test-malware-4-{RUN_ID}", "test-malware-detector", "code", "https://example.com/malware.zip", "Malware detection code"),
+    (f"test-virus-5-{RUN_ID}", "test-virus-scanner", "code", "https://example.com/virus.zip", "Virus scanning utility"),
+]
+# Sample artifact id by name, as yielded by the sample_artifacts fixtures
+SAMPLE_ARTIFACT_IDS = {name: artifact_id for artifact_id, name, _, _, _ in SAMPLE_ARTIFACTS}
+
+
+def _upsert_sample_artifacts(session):
+    """Insert the sample artifacts, or reset them to their canonical values"""
     from sqlalchemy import text
-    
-    # Clean existing test artifacts
-    db_session.execute(text("DELETE FROM artifacts WHERE id LIKE 'test-%'"))
-    db_session.commit()
-    
-    # Insert test artifacts with explicit IDs
-    artifacts = [
-        ("test-bert-1", "test-bert-model", "model", "https://example.com/bert.zip", "BERT base model for NLP"),
-        ("test-gpt-2", "test-gpt-model", "model", "https://example.com/gpt.zip", "GPT model for text generation"),
-        ("test-imagenet-3", "test-dataset-imagenet", "dataset", "https://example.com/imagenet.zip", "ImageNet dataset"),
-        ("test-malware-4", "test-malware-detector", "code", "https://example.com/malware.zip", "Malware detection code"),
-        ("test-virus-5", "test-virus-scanner", "code", "https://example.com/virus.zip", "Virus scanning utility"),
-    ]
-    
-    for artifact_id, name, type_, url, readme in artifacts:
-        # Insert new artifact with explicit id
-        db_session.execute(text("""
-            INSERT INTO artifacts (id, name, type, url, readme)
-            VALUES (:id, :name, :type, :url, :readme)
-            ON CONFLICT (id) DO UPDATE 
-            SET name = EXCLUDED.name,
-                type = EXCLUDED.type,
-                url = EXCLUDED.url,
-                readme = EXCLUDED.readme
-        """), {
+
+    # Insert with explicit ids, in one executemany
+    session.execute(text("""
+        INSERT INTO artifacts (id, name, type, url, readme)
+        VALUES (:id, :name, :type, :url, :readme)
+        ON CONFLICT (id) DO UPDATE 
+        SET name = EXCLUDED.name,
+            type = EXCLUDED.type,
+            url = EXCLUDED.url,
+            readme = EXCLUDED.readme
+    """), [
+        {
             "id": artifact_id,
             "name": name,
             "type": type_,
             "url": url,
             "readme": readme
-        })
-    
-    db_session.commit()
-    
-    yield
-    
-    # Cleanup
-    db_session.execute(text("DELETE FROM artifacts WHERE name LIKE 'test-%'"))
-    db_session.commit()
+        }
+        for artifact_id, name, type_, url, readme in SAMPLE_ARTIFACTS
+    ])
+    session.commit()
+
+
+@pytest.fixture(scope="session")
+def sample_artifacts(database_url):
+    """
+    Create sample artifacts for TypeScript API testing, once per session.
+    Yields their ids by name. Tests that change them must use
+    sample_artifacts_writable.
+    """
+    from sqlalchemy import bindparam, text
+
+    delete_samples = text("DELETE FROM artifacts WHERE id IN :ids").bindparams(
+        bindparam("ids", expanding=True)
+    )
+    ids = {"ids": list(SAMPLE_ARTIFACT_IDS.values())}
+    session = _sessionmaker_for(database_url)()
+    try:
+        # Clear this worker's leftovers; committed together with the inserts
+        session.execute(delete_samples, ids)
+        _upsert_sample_artifacts(session)
+
+        yield SAMPLE_ARTIFACT_IDS
+
+        # Cleanup
+        session.execute(delete_samples, ids)
+        session.commit()
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def sample_artifacts_writable(sample_artifacts, db_session):
+    """
+    Sample artifacts for a test that modifies them through the API. The server
+    commits on its own connection, so a rollback here can't undo its writes;
+    the rows are reset to their canonical values afterwards instead.
+    """
+    yield sample_artifacts
+    _upsert_sample_artifacts(db_session)
@@ -3,19 +3,75 @@ Artifact CRUD Tests
 Tests CREATE, READ, UPDATE, DELETE operations for artifacts API
 Validates that rating, cost, dependencies, uri, and size fields are properly stored and retrieved
 """
+import os
+
+import orjson
 import pytest
-import requests
-import json
+from sqlalchemy import text
+
+# Keep this module on one xdist worker (needs --dist loadgroup, set in pytest.ini)
+pytestmark = pytest.mark.xdist_group("artifacts_crud")
+
+# Suffix for fixed artifact ids, so concurrent runs against one server don't collide
+RUN_ID = os.environ.get("PYTEST_XDIST_WORKER", str(os.getpid()))
+DUPLICATE_ID = f"test-duplicate-{RUN_ID}"
+TO_DELETE_ID = f"test-to-delete-{RUN_ID}"
+
+# Statements built once and reused by every test
+SELECT_ARTIFACT = text("""
+    SELECT id, name, type, url, uri, size, rating, cost, dependencies
+    FROM artifacts
+    WHERE id = :id
+""")
+SELECT_URL_RATING = text("""
+    SELECT url, rating, cost, updated_at
+    FROM artifacts
+    WHERE id = :id
+""")
+SELECT_ID_ONLY = text("SELECT id FROM artifacts WHERE id = :id")
+
+# Fields each response must carry, checked with one set difference
+_MODEL_GET_FIELDS = frozenset({
+    "id", "name", "type", "metadata", "uri", "size", "rating", "cost", "dependencies",
+})
+_RATING_FIELDS = frozenset({
+    "quality", "size_score", "code_quality", "dataset_quality",
+    "performance_claims", "bus_factor", "ramp_up_time", "dataset_and_code_score",
+})
+# The subset stored with every artifact and returned by GET /artifacts
+_RATING_CORE_FIELDS = frozenset({"quality", "size_score", "code_quality", "bus_factor"})
+_SIZE_SCORE_DEVICES = frozenset({"raspberry_pi", "jetson_nano", "desktop_pc", "aws_server"})
+
+
+def json_of(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture
+def create_artifact(http, typescript_server_url, json_auth_headers, created_artifact_ids):
+    """
+    POST an artifact and return the response. Anything the server creates is
+    registered for deletion up front, so cleanup runs even if the test fails.
+    """
+    def create(artifact_type, artifact_data):
+        response = http.post(
+            f"{typescript_server_url}/artifacts/{artifact_type}",
+            headers=json_auth_headers,
+            json=artifact_data
+        )
+        if response.status_code == 201:
+            created_artifact_ids.append(json_of(response)["metadata"]["id"])
+        return response
+    return create
 
 
 class TestArtifactCreate:
     """Test POST /artifacts/{type} - Create artifact"""
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_create_model_artifact(self, typescript_server_url, auth_headers, db_session):
+    def test_create_model_artifact(self, db_session, create_artifact):
         """Test creating a new model artifact with all fields populated"""
-        from sqlalchemy import text
-        
         # Prepare artifact data
         artifact_data = {
             "data": {
@@ -23,11 +79,7 @@ class TestArtifactCreate:
             }
         }
         
-        response = requests.post(
-            f"{typescript_server_url}/artifacts/model",
-            headers={**auth_headers, "Content-Type": "application/json"},
-            json=artifact_data
-        )
+        response = create_artifact("model", artifact_data)
         
         # Validate response
         assert response.status_code == 201, (
@@ -35,7 +87,7 @@ class TestArtifactCreate:
             f"Response body: {response.text}"
         )
         
-        data = response.json()
+        data = json_of(response)
         assert "metadata" in data, f"Response missing 'metadata' field. Got: {data}"
         assert "id" in data["metadata"], f"Response metadata missing 'id'. Got: {data['metadata']}"
         assert "name" in data["metadata"], f"Response metadata missing 'name'. Got: {data['metadata']}"
@@ -46,11 +98,7 @@ class TestArtifactCreate:
         artifact_id = data["metadata"]["id"]
         
         # Verify artifact was stored in database with all fields
-        result = db_session.execute(text("""
-            SELECT id, name, type, url, uri, size, rating, cost, dependencies
-            FROM artifacts 
-            WHERE id = :id
-        """), {"id": artifact_id})
+        result = db_session.execute(SELECT_ARTIFACT, {"id": artifact_id})
         
         row = result.fetchone()
         assert row is not None, (
@@ -77,102 +125,72 @@ class TestArtifactCreate:
         
         # Parse JSON fields
         try:
-            rating = json.loads(db_rating) if isinstance(db_rating, str) else db_rating
-        except json.JSONDecodeError as e:
+            rating = orjson.loads(db_rating) if isinstance(db_rating, (str, bytes)) else db_rating
+        except orjson.JSONDecodeError as e:
             pytest.fail(f"Failed to parse rating JSON from database: {e}. Value: {db_rating}")
         
         try:
-            cost = json.loads(db_cost) if isinstance(db_cost, str) else db_cost
-        except json.JSONDecodeError as e:
+            cost = orjson.loads(db_cost) if isinstance(db_cost, (str, bytes)) else db_cost
+        except orjson.JSONDecodeError as e:
             pytest.fail(f"Failed to parse cost JSON from database: {e}. Value: {db_cost}")
         
         # Validate rating structure
-        assert "quality" in rating, f"Rating missing 'quality' field. Got: {rating}"
-        assert "size_score" in rating, f"Rating missing 'size_score' field. Got: {rating}"
-        assert "code_quality" in rating, f"Rating missing 'code_quality' field. Got: {rating}"
-        assert "bus_factor" in rating, f"Rating missing 'bus_factor' field. Got: {rating}"
+        missing = _RATING_CORE_FIELDS - rating.keys()
+        assert not missing, f"Rating missing fields {sorted(missing)}. Got: {rating}"
         
         # Validate cost structure
         assert "inference_cents" in cost or "storage" in cost, (
             f"Cost should have 'inference_cents' or 'storage' field. Got: {cost}"
         )
-        
-        # Cleanup
-        db_session.execute(text("DELETE FROM artifacts WHERE id = :id"), {"id": artifact_id})
-        db_session.commit()
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_create_dataset_artifact(self, typescript_server_url, auth_headers, db_session):
+    def test_create_dataset_artifact(self, create_artifact):
         """Test creating a dataset artifact"""
-        from sqlalchemy import text
-        
         artifact_data = {
             "data": {
                 "url": "https://huggingface.co/datasets/test-dataset"
             }
         }
         
-        response = requests.post(
-            f"{typescript_server_url}/artifacts/dataset",
-            headers={**auth_headers, "Content-Type": "application/json"},
-            json=artifact_data
-        )
+        response = create_artifact("dataset", artifact_data)
         
         assert response.status_code == 201, (
             f"Expected 201 Created for dataset but got {response.status_code}. "
             f"Response: {response.text}"
         )
         
-        data = response.json()
+        data = json_of(response)
         assert data["metadata"]["type"] == "dataset", (
             f"Expected type='dataset' but got '{data['metadata']['type']}'"
         )
-        
-        # Cleanup
-        artifact_id = data["metadata"]["id"]
-        db_session.execute(text("DELETE FROM artifacts WHERE id = :id"), {"id": artifact_id})
-        db_session.commit()
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_create_code_artifact(self, typescript_server_url, auth_headers, db_session):
+    def test_create_code_artifact(self, create_artifact):
         """Test creating a code artifact"""
-        from sqlalchemy import text
-        
         artifact_data = {
             "data": {
                 "url": "https://github.com/test-org/test-repo"
             }
         }
         
-        response = requests.post(
-            f"{typescript_server_url}/artifacts/code",
-            headers={**auth_headers, "Content-Type": "application/json"},
-            json=artifact_data
-        )
+        response = create_artifact("code", artifact_data)
         
         assert response.status_code == 201, (
             f"Expected 201 Created for code artifact but got {response.status_code}. "
             f"Response: {response.text}"
         )
         
-        data = response.json()
+        data = json_of(response)
         assert data["metadata"]["type"] == "code", (
             f"Expected type='code' but got '{data['metadata']['type']}'"
         )
-        
-        # Cleanup
-        artifact_id = data["metadata"]["id"]
-        db_session.execute(text("DELETE FROM artifacts WHERE id = :id"), {"id": artifact_id})
-        db_session.commit()
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_create_duplicate_artifact_fails(self, typescript_server_url, auth_headers, db_session):
+    def test_create_duplicate_artifact_fails(self, create_artifact):
         """Test that creating duplicate artifact returns 409 Conflict"""
-        from sqlalchemy import text
-        
         artifact_data = {
             "metadata": {
-                "id": "test-duplicate-12345"
+                "id": DUPLICATE_ID
             },
             "data": {
                 "url": "https://example.com/duplicate-test"
@@ -180,41 +198,29 @@ class TestArtifactCreate:
         }
         
         # Create first artifact
-        response1 = requests.post(
-            f"{typescript_server_url}/artifacts/model",
-            headers={**auth_headers, "Content-Type": "application/json"},
-            json=artifact_data
-        )
+        response1 = create_artifact("model", artifact_data)
         
         if response1.status_code != 201:
             pytest.skip(f"First creation failed with {response1.status_code}, cannot test duplicate")
         
         # Attempt to create duplicate
-        response2 = requests.post(
-            f"{typescript_server_url}/artifacts/model",
-            headers={**auth_headers, "Content-Type": "application/json"},
-            json=artifact_data
-        )
+        response2 = create_artifact("model", artifact_data)
         
         assert response2.status_code == 409, (
             f"Expected 409 Conflict when creating duplicate artifact, "
             f"but got {response2.status_code}. Response: {response2.text}"
         )
-        
-        # Cleanup
-        db_session.execute(text("DELETE FROM artifacts WHERE id = :id"), 
-                          {"id": "test-duplicate-12345"})
-        db_session.commit()
 
 
 class TestArtifactRead:
     """Test GET /artifacts/{type}/{id} - Read artifact"""
     
-    @pytest.mark.usefixtures("typescript_server", "sample_artifacts")
-    def test_get_existing_artifact(self, typescript_server_url, auth_headers):
+    @pytest.mark.usefixtures("typescript_server")
+    def test_get_existing_artifact(self, http, typescript_server_url, auth_headers, sample_artifacts):
         """Test retrieving an existing artifact with all fields"""
-        response = requests.get(
-            f"{typescript_server_url}/artifacts/model/test-bert-1",
+        artifact_id = sample_artifacts["test-bert-model"]
+        response = http.get(
+            f"{typescript_server_url}/artifacts/model/{artifact_id}",
             headers=auth_headers
         )
         
@@ -223,36 +229,27 @@ class TestArtifactRead:
             f"Response: {response.text}"
         )
         
-        data = response.json()
+        data = json_of(response)
+        
+        # Validate fields (new ones should be present even if default/stub values)
+        missing = _MODEL_GET_FIELDS - data.keys()
+        assert not missing, f"Response missing fields {sorted(missing)}. Got: {data}"
         
         # Validate core fields
-        assert "id" in data, f"Response missing 'id' field. Got: {data}"
-        assert data["id"] == "test-bert-1", (
-            f"ID mismatch: expected 'test-bert-1', got '{data['id']}'"
+        assert data["id"] == artifact_id, (
+            f"ID mismatch: expected '{artifact_id}', got '{data['id']}'"
         )
-        assert "name" in data, f"Response missing 'name' field. Got: {data}"
-        assert "type" in data, f"Response missing 'type' field. Got: {data}"
         assert data["type"] == "model", f"Type mismatch: expected 'model', got '{data['type']}'"
         
         # Validate metadata fields
-        assert "metadata" in data, f"Response missing 'metadata' field. Got: {data}"
         metadata = data["metadata"]
         assert "url" in metadata, f"Metadata missing 'url' field. Got: {metadata}"
         
-        # Validate new fields (should be present even if default/stub values)
-        assert "uri" in data, f"Response missing 'uri' field. Got: {data}"
-        assert "size" in data, f"Response missing 'size' field. Got: {data}"
-        assert "rating" in data, f"Response missing 'rating' field. Got: {data}"
-        assert "cost" in data, f"Response missing 'cost' field. Got: {data}"
-        assert "dependencies" in data, f"Response missing 'dependencies' field. Got: {data}"
-        
         # Validate rating structure
         rating = data["rating"]
         assert isinstance(rating, dict), f"Rating should be dict/object, got {type(rating)}"
-        assert "quality" in rating, f"Rating missing 'quality'. Got: {rating}"
-        assert "size_score" in rating, f"Rating missing 'size_score'. Got: {rating}"
-        assert "code_quality" in rating, f"Rating missing 'code_quality'. Got: {rating}"
-        assert "bus_factor" in rating, f"Rating missing 'bus_factor'. Got: {rating}"
+        missing = _RATING_CORE_FIELDS - rating.keys()
+        assert not missing, f"Rating missing fields {sorted(missing)}. Got: {rating}"
         
         # Validate cost structure
         cost = data["cost"]
@@ -265,9 +262,9 @@ class TestArtifactRead:
         )
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_get_nonexistent_artifact(self, typescript_server_url, auth_headers):
+    def test_get_nonexistent_artifact(self, http, typescript_server_url, auth_headers):
         """Test retrieving non-existent artifact returns 404"""
-        response = requests.get(
+        response = http.get(
             f"{typescript_server_url}/artifacts/model/nonexistent-id-99999",
             headers=auth_headers
         )
@@ -277,12 +274,12 @@ class TestArtifactRead:
             f"Response: {response.text}"
         )
     
-    @pytest.mark.usefixtures("typescript_server", "sample_artifacts")
-    def test_get_artifact_wrong_type(self, typescript_server_url, auth_headers):
+    @pytest.mark.usefixtures("typescript_server")
+    def test_get_artifact_wrong_type(self, http, typescript_server_url, auth_headers, sample_artifacts):
         """Test retrieving artifact with wrong type returns 404"""
-        # test-bert-1 is a model, try to get it as dataset
-        response = requests.get(
-            f"{typescript_server_url}/artifacts/dataset/test-bert-1",
+        # test-bert-model is a model, try to get it as dataset
+        response = http.get(
+            f"{typescript_server_url}/artifacts/dataset/{sample_artifacts['test-bert-model']}",
             headers=auth_headers
         )
         
@@ -295,20 +292,19 @@ class TestArtifactRead:
 class TestArtifactUpdate:
     """Test PUT /artifacts/{type}/{id} - Update artifact"""
     
-    @pytest.mark.usefixtures("typescript_server", "sample_artifacts")
-    def test_update_artifact_url(self, typescript_server_url, auth_headers, db_session):
+    @pytest.mark.usefixtures("typescript_server")
+    def test_update_artifact_url(self, http, typescript_server_url, auth_headers, json_auth_headers, db_session,
+                                 sample_artifacts_writable):
         """Test updating artifact URL and verify metrics are recomputed"""
-        from sqlalchemy import text
-        
-        artifact_id = "test-bert-1"
+        artifact_id = sample_artifacts_writable["test-bert-model"]
         
         # Get original artifact
-        response_before = requests.get(
+        response_before = http.get(
             f"{typescript_server_url}/artifacts/model/{artifact_id}",
             headers=auth_headers
         )
         assert response_before.status_code == 200, "Setup failed: artifact doesn't exist"
-        original_data = response_before.json()
+        original_data = json_of(response_before)
         
         # Update artifact
         update_data = {
@@ -317,9 +313,9 @@ class TestArtifactUpdate:
             }
         }
         
-        response = requests.put(
+        response = http.put(
             f"{typescript_server_url}/artifacts/model/{artifact_id}",
-            headers={**auth_headers, "Content-Type": "application/json"},
+            headers=json_auth_headers,
             json=update_data
         )
         
@@ -329,11 +325,7 @@ class TestArtifactUpdate:
         )
         
         # Verify update was persisted
-        result = db_session.execute(text("""
-            SELECT url, rating, cost, updated_at
-            FROM artifacts 
-            WHERE id = :id
-        """), {"id": artifact_id})
+        result = db_session.execute(SELECT_URL_RATING, {"id": artifact_id})
         
         row = result.fetchone()
         assert row is not None, f"Artifact {artifact_id} disappeared after update"
@@ -353,7 +345,7 @@ class TestArtifactUpdate:
         )
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_update_nonexistent_artifact(self, typescript_server_url, auth_headers):
+    def test_update_nonexistent_artifact(self, http, typescript_server_url, json_auth_headers):
         """Test updating non-existent artifact returns 404"""
         update_data = {
             "data": {
@@ -361,9 +353,9 @@ class TestArtifactUpdate:
             }
         }
         
-        response = requests.put(
+        response = http.put(
             f"{typescript_server_url}/artifacts/model/nonexistent-id-99999",
-            headers={**auth_headers, "Content-Type": "application/json"},
+            headers=json_auth_headers,
             json=update_data
         )
         
@@ -377,32 +369,26 @@ class TestArtifactDelete:
     """Test DELETE /artifacts/{type}/{id} - Delete artifact"""
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_delete_artifact(self, typescript_server_url, auth_headers, db_session):
+    def test_delete_artifact(self, http, typescript_server_url, auth_headers, db_session, create_artifact):
         """Test deleting an artifact"""
-        from sqlalchemy import text
-        
         # Create artifact to delete
         artifact_data = {
             "metadata": {
-                "id": "test-to-delete-123"
+                "id": TO_DELETE_ID
             },
             "data": {
                 "url": "https://example.com/to-delete"
             }
         }
         
-        create_response = requests.post(
-            f"{typescript_server_url}/artifacts/model",
-            headers={**auth_headers, "Content-Type": "application/json"},
-            json=artifact_data
-        )
+        create_response = create_artifact("model", artifact_data)
         
         if create_response.status_code != 201:
             pytest.skip(f"Setup failed: couldn't create artifact. Got {create_response.status_code}")
         
         # Delete artifact
-        response = requests.delete(
-            f"{typescript_server_url}/artifacts/model/test-to-delete-123",
+        response = http.delete(
+            f"{typescript_server_url}/artifacts/model/{TO_DELETE_ID}",
             headers=auth_headers
         )
         
@@ -412,20 +398,18 @@ class TestArtifactDelete:
         )
         
         # Verify artifact was deleted from database
-        result = db_session.execute(text("""
-            SELECT id FROM artifacts WHERE id = :id
-        """), {"id": "test-to-delete-123"})
+        result = db_session.execute(SELECT_ID_ONLY, {"id": TO_DELETE_ID})
         
         row = result.fetchone()
         assert row is None, (
-            f"Artifact with id='test-to-delete-123' still exists in database after DELETE. "
+            f"Artifact with id='{TO_DELETE_ID}' still exists in database after DELETE. "
             f"DELETE operation failed to remove artifact."
         )
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_delete_nonexistent_artifact(self, typescript_server_url, auth_headers):
+    def test_delete_nonexistent_artifact(self, http, typescript_server_url, auth_headers):
         """Test deleting non-existent artifact returns 404"""
-        response = requests.delete(
+        response = http.delete(
             f"{typescript_server_url}/artifacts/model/nonexistent-id-99999",
             headers=auth_headers
         )
@@ -439,11 +423,11 @@ class TestArtifactDelete:
 class TestModelRating:
     """Test GET /artifact/model/{id}/rate - Get model rating"""
     
-    @pytest.mark.usefixtures("typescript_server", "sample_artifacts")
-    def test_get_model_rating(self, typescript_server_url, auth_headers):
+    @pytest.mark.usefixtures("typescript_server")
+    def test_get_model_rating(self, http, typescript_server_url, auth_headers, sample_artifacts):
         """Test retrieving model rating with phase1 metrics"""
-        response = requests.get(
-            f"{typescript_server_url}/artifact/model/test-bert-1/rate",
+        response = http.get(
+            f"{typescript_server_url}/artifact/model/{sample_artifacts['test-bert-model']}/rate",
             headers=auth_headers
         )
         
@@ -452,27 +436,19 @@ class TestModelRating:
             f"Response: {response.text}"
         )
         
-        data = response.json()
+        data = json_of(response)
         
         # Validate rating structure matches RatingMetrics interface
-        assert "quality" in data, f"Rating missing 'quality' field. Got: {data}"
-        assert "size_score" in data, f"Rating missing 'size_score' field. Got: {data}"
-        assert "code_quality" in data, f"Rating missing 'code_quality' field. Got: {data}"
-        assert "dataset_quality" in data, f"Rating missing 'dataset_quality' field. Got: {data}"
-        assert "performance_claims" in data, f"Rating missing 'performance_claims' field. Got: {data}"
-        assert "bus_factor" in data, f"Rating missing 'bus_factor' field. Got: {data}"
-        assert "ramp_up_time" in data, f"Rating missing 'ramp_up_time' field. Got: {data}"
-        assert "dataset_and_code_score" in data, f"Rating missing 'dataset_and_code_score' field. Got: {data}"
+        missing = _RATING_FIELDS - data.keys()
+        assert not missing, f"Rating missing fields {sorted(missing)}. Got: {data}"
         
         # Validate size_score structure (should be object with device scores)
         size_score = data["size_score"]
         assert isinstance(size_score, dict), (
             f"size_score should be object/dict, got {type(size_score)}"
         )
-        assert "raspberry_pi" in size_score, f"size_score missing 'raspberry_pi'. Got: {size_score}"
-        assert "jetson_nano" in size_score, f"size_score missing 'jetson_nano'. Got: {size_score}"
-        assert "desktop_pc" in size_score, f"size_score missing 'desktop_pc'. Got: {size_score}"
-        assert "aws_server" in size_score, f"size_score missing 'aws_server'. Got: {size_score}"
+        missing = _SIZE_SCORE_DEVICES - size_score.keys()
+        assert not missing, f"size_score missing devices {sorted(missing)}. Got: {size_score}"
         
         # Validate numeric ranges
         assert 0 <= data["quality"] <= 1, (
@@ -483,9 +459,9 @@ class TestModelRating:
         )
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_get_rating_for_nonexistent_model(self, typescript_server_url, auth_headers):
+    def test_get_rating_for_nonexistent_model(self, http, typescript_server_url, auth_headers):
         """Test getting rating for non-existent model returns 404"""
-        response = requests.get(
+        response = http.get(
             f"{typescript_server_url}/artifact/model/nonexistent-id-99999/rate",
             headers=auth_headers
         )
@@ -500,10 +476,9 @@ class TestArtifactFieldValidation:
     """Test that all expected fields are properly populated and validated"""
     
     @pytest.mark.usefixtures("typescript_server")
-    def test_created_artifact_has_all_fields(self, typescript_server_url, auth_headers, db_session):
+    def test_created_artifact_has_all_fields(self, http, typescript_server_url, auth_headers,
+                                             create_artifact):
         """Test that newly created artifact has uri, size, rating, cost, dependencies"""
-        from sqlalchemy import text
-        
         artifact_data = {
             "data": {
                 "url": "https://huggingface.co/test-validation/model"
@@ -511,31 +486,26 @@ class TestArtifactFieldValidation:
         }
         
         # Create artifact
-        create_response = requests.post(
-            f"{typescript_server_url}/artifacts/model",
-            headers={**auth_headers, "Content-Type": "application/json"},
-            json=artifact_data
-        )
+        create_response = create_artifact("model", artifact_data)
         
         assert create_response.status_code == 201, f"Setup failed: {create_response.text}"
-        artifact_id = create_response.json()["metadata"]["id"]
+        artifact_id = json_of(create_response)["metadata"]["id"]
         
         # Get artifact
-        get_response = requests.get(
+        get_response = http.get(
             f"{typescript_server_url}/artifacts/model/{artifact_id}",
             headers=auth_headers
         )
         
         assert get_response.status_code == 200, f"Failed to retrieve created artifact"
-        data = get_response.json()
+        data = json_of(get_response)
         
         # Comprehensive field validation
-        required_fields = ["id", "name", "type", "metadata", "uri", "size", "rating", "cost", "dependencies"]
-        for field in required_fields:
-            assert field in data, (
-                f"Created artifact missing required field '{field}'. "
-                f"Available fields: {list(data.keys())}"
-            )
+        missing = _MODEL_GET_FIELDS - data.keys()
+        assert not missing, (
+            f"Created artifact missing required fields {sorted(missing)}. "
+            f"Available fields: {list(data.keys())}"
+        )
         
         # Type validation
         assert isinstance(data["uri"], str), f"uri should be string, got {type(data['uri'])}"
@@ -547,7 +517,3 @@ class TestArtifactFieldValidation:
         # Value validation
         assert data["uri"].startswith("s3://"), f"uri should be S3 path, got: {data['uri']}"
         assert data["size"] > 0, f"size should be positive, got: {data['size']}"
-        
-        # Cleanup
-        db_session.execute(text("DELETE FROM artifacts WHERE id = :id"), {"id": artifact_id})
-        db_session.commit()
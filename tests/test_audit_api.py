@@ -0,0 +1,89 @@
+"""
+Audit API Tests
+Verifies the audit endpoints enforce logs_api.require_admin under both
+ways packages_api gets imported
+"""
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+REPO_ROOT = Path(__file__).parent.parent
+for path in (REPO_ROOT, REPO_ROOT / "phase2" / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+# (package prefix, logs_api module) per layout: nested resolves ..logs_api,
+# top-level falls back to the logs_api module on sys.path
+LAYOUTS = {
+    "nested": ("phase2.src.packages_api", "phase2.src.logs_api"),
+    "top_level": ("packages_api", "logs_api"),
+}
+
+
+@pytest.fixture(params=sorted(LAYOUTS))
+def audit_app(request):
+    """App serving the audit router from one import layout, on in-memory SQLite"""
+    package, logs_module = LAYOUTS[request.param]
+    audit_api = importlib.import_module(f"{package}.audit_api")
+    database = importlib.import_module(f"{package}.database")
+    logs_api = importlib.import_module(logs_module)
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    database.Base.metadata.create_all(bind=engine)
+    TestSessionLocal = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = TestSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(audit_api.router)
+    app.dependency_overrides[database.get_db] = override_get_db
+    yield app, audit_api, logs_api
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+class TestAuditEndpointsRequireAdmin:
+    """Test audit endpoints use the real admin check"""
+
+    def test_uses_logs_api_require_admin(self, audit_app):
+        """The import fallback must not land on the permissive stub"""
+        _, audit_api, logs_api = audit_app
+        assert audit_api.require_admin is logs_api.require_admin
+
+    @pytest.mark.parametrize("role", ["viewer", "uploader"])
+    def test_audit_logs_non_admin_forbidden(self, audit_app, role):
+        """Non-admin users should get 403 on audit logs"""
+        app, _, logs_api = audit_app
+        app.dependency_overrides[logs_api.get_current_user_role] = lambda: role
+
+        response = TestClient(app).get("/audit/logs")
+
+        assert response.status_code == 403
+        assert "Admin privileges required" in response.json()["detail"]
+
+    def test_audit_logs_admin_allowed(self, audit_app):
+        """Admin users should get 200 on audit logs"""
+        app, _, logs_api = audit_app
+        app.dependency_overrides[logs_api.get_current_user_role] = lambda: "admin"
+
+        response = TestClient(app).get("/audit/logs")
+
+        assert response.status_code == 200
+        assert response.json() == []
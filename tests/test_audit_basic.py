@@ -10,22 +10,49 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "phase2" / "src"))
 
 import pytest
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from packages_api.database import Base, AuditLog
-from packages_api.audit import record_audit, query_audit_logs
+from packages_api.audit import record_audit, record_audit_bulk, query_audit_logs
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory SQLite database for testing"""
-    engine = create_engine("sqlite:///:memory:")
+@pytest.fixture(scope="module")
+def test_engine():
+    """In-memory SQLite database with the schema created once for the module"""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db(test_engine):
+    """Session inside a transaction that is rolled back after each test"""
+    connection = test_engine.connect()
+    trans = connection.begin()
+    # commit() in the code under test only releases a SAVEPOINT
+    TestSessionLocal = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     db = TestSessionLocal()
     yield db
     db.close()
+    trans.rollback()
+    connection.close()
 
 
 def test_record_audit_basic(test_db):
@@ -102,8 +129,7 @@ def test_query_audit_logs_action_filter(test_db):
 
 def test_query_audit_logs_limit(test_db):
     """Test limit parameter"""
-    for i in range(20):
-        record_audit(test_db, f"action{i}")
+    record_audit_bulk(test_db, [{"action": f"action{i}"} for i in range(20)])
     
     logs = query_audit_logs(test_db, limit=5)
     assert len(logs) == 5
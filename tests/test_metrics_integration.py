@@ -0,0 +1,40 @@
+"""
+Tests for the Phase 1 metrics integration helpers
+"""
+import sys
+from pathlib import Path
+
+# Add phase2/src to Python path for imports
+PHASE2_SRC = Path(__file__).parent.parent / "phase2" / "src"
+sys.path.insert(0, str(PHASE2_SRC))
+
+from packages_api.metrics_integration import _parse_url
+from src.cli.url import CodeURL, DatasetURL, ModelURL
+
+
+class TestParseUrl:
+    """Cached URL parsing must still hand out independent URL objects"""
+
+    def test_each_call_gets_a_fresh_url(self):
+        first = _parse_url(ModelURL, "https://huggingface.co/org/model")
+        second = _parse_url(ModelURL, "https://huggingface.co/org/model")
+        assert first is not second
+        assert first == second == ModelURL("https://huggingface.co/org/model")
+
+        # Mutating one rating's URL must not leak into the next
+        first.name = "changed"
+        assert _parse_url(ModelURL, "https://huggingface.co/org/model").name == "model"
+
+    def test_matches_direct_construction(self):
+        cases = [
+            (ModelURL, "https://huggingface.co/bert-base"),
+            (CodeURL, "https://github.com/org/repo"),
+            (DatasetURL, "https://huggingface.co/datasets/org/data"),
+            (DatasetURL, "https://www.image-net.org/data/train.tar"),
+            (CodeURL, "not-a-url"),
+        ]
+        for url_cls, raw in cases:
+            parsed = _parse_url(url_cls, raw)
+            expected = url_cls(raw)
+            assert parsed == expected
+            assert parsed.validate() == expected.validate()
@@ -83,6 +83,11 @@ def test_upload_get_and_delete_cycle():
     pkg_id = j["id"]
     assert j.get("s3_uri") and j["s3_uri"].startswith("s3://")
 
+    # Legacy uploads still advertise the /packages/<id> download URL
+    resp_meta = client.get(f"/artifacts/model/{pkg_id}")
+    assert resp_meta.status_code == 200, resp_meta.text
+    assert resp_meta.json()["data"]["download_url"].endswith(f"/packages/{pkg_id}")
+
     # Download full package
     resp2 = client.get(f"/packages/{pkg_id}")
     assert resp2.status_code == 200
@@ -95,3 +100,238 @@ def test_upload_get_and_delete_cycle():
     # Confirm deleted
     resp4 = client.get(f"/packages/{pkg_id}")
     assert resp4.status_code == 404
+
+
+def test_invalid_body_returns_fastapi_422_detail():
+    # Missing field, wrong type and malformed JSON all keep FastAPI's error list shape
+    resp = client.post("/artifact/model", json={"nourl": 1})
+    assert resp.status_code == 422
+    assert resp.json() == {
+        "detail": [{"loc": ["body", "url"], "msg": "Field required", "type": "missing"}]
+    }
+
+    resp = client.post("/artifacts", json=[{"name": 1}])
+    assert resp.status_code == 422
+    [error] = resp.json()["detail"]
+    assert error["loc"] == ["body", 0, "name"]
+    assert error["type"] == "value_error"
+    assert error["msg"]
+
+    resp = client.post(
+        "/artifacts", content=b"[", headers={"Content-Type": "application/json"}
+    )
+    assert resp.status_code == 422
+    [error] = resp.json()["detail"]
+    assert error["loc"] == ["body"]
+    assert error["type"] == "json_invalid"
+
+
+JSON_BODY_ROUTES = [
+    ("put", "/authenticate", {"user", "secret"}),
+    ("post", "/artifacts", None),
+    ("post", "/artifact/byRegEx", {"regex"}),
+    ("post", "/artifact/model/{artifact_id}/license-check", {"github_url"}),
+    ("post", "/artifact/{artifact_type}", {"url"}),
+    ("put", "/artifacts/{artifact_type}/{artifact_id}", set()),
+]
+
+
+def test_openapi_declares_json_request_bodies():
+    # Bodies decoded by MsgspecBody are invisible to FastAPI unless declared
+    paths = app.openapi()["paths"]
+    for method, path, required in JSON_BODY_ROUTES:
+        body = paths[path][method].get("requestBody")
+        assert body and body["required"] is True, (method, path)
+        schema = body["content"]["application/json"]["schema"]
+        if required is None:
+            assert schema["type"] == "array"
+            schema = schema["items"]
+        assert schema["type"] == "object", (method, path)
+        expected = {"name"} if required is None else required
+        assert set(schema.get("required", ())) == expected, (method, path)
+
+
+def test_update_rejects_non_object_data():
+    resp = client.post("/artifact/model", json={"url": "https://huggingface.co/org/update-me"})
+    assert resp.status_code == 201, resp.text
+    artifact_id = resp.json()["metadata"]["id"]
+
+    for data in ("not-an-object", [1, 2], None):
+        resp = client.put(f"/artifacts/model/{artifact_id}", json={"data": data})
+        assert resp.status_code == 422, resp.text
+        [error] = resp.json()["detail"]
+        assert error["loc"] == ["body", "data"]
+
+    resp = client.get(f"/artifacts/model/{artifact_id}")
+    assert resp.json()["data"]["url"] == "https://huggingface.co/org/update-me"
+
+    resp = client.put(
+        f"/artifacts/model/{artifact_id}", json={"data": {"url": "https://huggingface.co/org/updated"}}
+    )
+    assert resp.status_code == 200, resp.text
+    resp = client.get(f"/artifacts/model/{artifact_id}")
+    assert resp.json()["data"]["url"] == "https://huggingface.co/org/updated"
+
+
+def _batcher_rows(artifact_id, count):
+    return [
+        {"id": artifact_id, "name": f"dup-{n}", "artifact_type": "model",
+         "url": f"https://huggingface.co/org/dup-{n}"}
+        for n in range(count)
+    ]
+
+
+def test_create_artifact_concurrent_duplicate_id_gets_201_and_409(monkeypatch):
+    import asyncio
+    import uuid
+    import httpx
+
+    pkg_main = importlib.import_module("phase2.src.packages_api.main")
+    artifact_id = f"dup-{uuid.uuid4().hex[:12]}"
+    monkeypatch.setattr(pkg_main, "generate_artifact_id", lambda name: artifact_id)
+
+    async def post_both():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await asyncio.gather(
+                ac.post("/artifact/model", json={"url": "https://huggingface.co/org/first"}),
+                ac.post("/artifact/model", json={"url": "https://huggingface.co/org/second"}),
+            )
+
+    responses = asyncio.run(asyncio.wait_for(post_both(), timeout=10))
+    assert sorted(r.status_code for r in responses) == [201, 409]
+
+
+def test_insert_batcher_falls_back_per_row(monkeypatch):
+    import asyncio
+    import uuid
+    from sqlalchemy.exc import IntegrityError
+
+    pkg_main = importlib.import_module("phase2.src.packages_api.main")
+    batcher = pkg_main.ArtifactInsertBatcher()
+    batch_sizes = []
+    write = pkg_main.ArtifactInsertBatcher._write
+
+    def recording_write(bind, rows):
+        batch_sizes.append(len(rows))
+        return write(bind, rows)
+
+    monkeypatch.setattr(batcher, "_write", recording_write)
+
+    async def insert_both():
+        rows = _batcher_rows(f"dup-{uuid.uuid4().hex[:12]}", 2)
+        return await asyncio.gather(*(batcher.insert(pkg_main.engine, row) for row in rows), return_exceptions=True)
+
+    first, second = asyncio.run(asyncio.wait_for(insert_both(), timeout=10))
+    # Both rows went in one batch; the failed batch is retried row by row
+    assert batch_sizes == [2]
+    assert first is None
+    assert isinstance(second, IntegrityError)
+
+
+def test_insert_batcher_fails_waiters_when_write_raises(monkeypatch):
+    import asyncio
+    import uuid
+
+    pkg_main = importlib.import_module("phase2.src.packages_api.main")
+    batcher = pkg_main.ArtifactInsertBatcher()
+
+    def broken_write(bind, rows):
+        raise TypeError("not a DB error")
+
+    monkeypatch.setattr(batcher, "_write", broken_write)
+
+    async def insert_both():
+        rows = _batcher_rows(f"err-{uuid.uuid4().hex[:12]}", 2)
+        return await asyncio.gather(*(batcher.insert(pkg_main.engine, row) for row in rows), return_exceptions=True)
+
+    # Callers get the error instead of waiting forever
+    results = asyncio.run(asyncio.wait_for(insert_both(), timeout=10))
+    assert all(isinstance(r, TypeError) for r in results)
+
+
+def _separate_database(pkg_main):
+    """A fresh in-memory database plus a get_db override that uses it."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    other_engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    pkg_main.Base.metadata.create_all(bind=other_engine)
+    OtherSession = sessionmaker(bind=other_engine)
+
+    def override_get_db():
+        db = OtherSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return other_engine, override_get_db
+
+
+def test_create_artifact_writes_through_get_db_override():
+    from sqlalchemy import text
+
+    pkg_main = importlib.import_module("phase2.src.packages_api.main")
+    other_engine, override_get_db = _separate_database(pkg_main)
+
+    app.dependency_overrides[pkg_main.get_db] = override_get_db
+    try:
+        resp = client.post("/artifact/model", json={"url": "https://huggingface.co/org/override"})
+    finally:
+        app.dependency_overrides.clear()
+    assert resp.status_code == 201, resp.text
+    artifact_id = resp.json()["metadata"]["id"]
+
+    with other_engine.connect() as conn:
+        count = conn.execute(
+            text("SELECT COUNT(*) FROM artifacts WHERE id = :id"), {"id": artifact_id}
+        ).scalar()
+    assert count == 1
+    assert client.get(f"/artifacts/model/{artifact_id}").status_code == 404
+
+
+def test_list_packages_streams_from_get_db_override():
+    from sqlalchemy import insert
+
+    pkg_main = importlib.import_module("phase2.src.packages_api.main")
+    other_engine, override_get_db = _separate_database(pkg_main)
+    rows = [
+        {"id": f"stream-{n}", "name": f"stream-{n}", "artifact_type": "model",
+         "url": f"https://huggingface.co/org/stream-{n}"}
+        for n in range(3)
+    ]
+    with other_engine.begin() as conn:
+        conn.execute(insert(pkg_main.Artifact), rows)
+
+    app.dependency_overrides[pkg_main.get_db] = override_get_db
+    try:
+        resp = client.get("/packages")
+    finally:
+        app.dependency_overrides.clear()
+    assert resp.status_code == 200, resp.text
+    assert sorted(p["id"] for p in resp.json()) == ["stream-0", "stream-1", "stream-2"]
+
+
+def test_list_artifacts_predicates_use_lower_indexes():
+    from sqlalchemy import and_, func, select
+
+    pkg_main = importlib.import_module("phase2.src.packages_api.main")
+    table = pkg_main.artifacts_table
+    lower_name = func.lower(table.c.name)
+    lower_type = func.lower(table.c.artifact_type)
+    cases = [
+        (lower_name.in_(["a", "b"]), "ix_artifacts_lower_name"),
+        (and_(lower_name == "a", lower_type.in_(["model"])), "ix_artifacts_lower_type_name"),
+        (lower_type.in_(["model", "code"]), "ix_artifacts_lower_type_name"),
+    ]
+    with pkg_main.engine.connect() as conn:
+        for where, index in cases:
+            sql = select(*pkg_main.ARTIFACT_SUMMARY_COLUMNS).where(where).compile(
+                conn, compile_kwargs={"literal_binds": True}
+            )
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+            assert f"USING INDEX {index}" in plan, plan
@@ -0,0 +1,132 @@
+"""
+Tests for S3Client.delete_prefix in local and S3 modes
+"""
+import io
+import threading
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add phase2/src to path
+PHASE2_SRC = Path(__file__).parent.parent / "phase2" / "src"
+sys.path.insert(0, str(PHASE2_SRC))
+
+from packages_api import s3_client
+from packages_api.s3_client import S3Client
+
+
+@pytest.fixture
+def local_client(tmp_path, monkeypatch):
+    monkeypatch.setattr(s3_client, "S3_LOCAL_DIR", str(tmp_path))
+    return S3Client()
+
+
+def _put(client, key):
+    client.upload_fileobj(io.BytesIO(key.encode()), key)
+
+
+def _keys(client):
+    bucket_dir = client.local_dir / s3_client.S3_BUCKET
+    return sorted(
+        str(p.relative_to(bucket_dir)).replace("\\", "/")
+        for p in bucket_dir.rglob("*") if p.is_file()
+    )
+
+
+class TestDeletePrefixLocal:
+    KEYS = [
+        "packages/12/a.zip",
+        "packages/12/nested/b.zip",
+        "packages/12x/c.zip",
+        "packages/123.zip",
+        "packages/1",
+        "packages/2/d.zip",
+        "other/12/e.zip",
+    ]
+
+    def test_removes_only_keys_under_prefix(self, local_client):
+        for key in self.KEYS:
+            _put(local_client, key)
+
+        local_client.delete_prefix("packages/12")
+
+        # Partial names match like S3 prefixes; siblings and other trees stay
+        assert _keys(local_client) == ["other/12/e.zip", "packages/1", "packages/2/d.zip"]
+
+    def test_directory_prefix(self, local_client):
+        for key in self.KEYS:
+            _put(local_client, key)
+
+        local_client.delete_prefix("packages/12/")
+
+        assert _keys(local_client) == [
+            "other/12/e.zip",
+            "packages/1",
+            "packages/123.zip",
+            "packages/12x/c.zip",
+            "packages/2/d.zip",
+        ]
+
+    def test_missing_prefix_is_a_no_op(self, local_client):
+        _put(local_client, "packages/1")
+
+        local_client.delete_prefix("nothing/here")
+        local_client.delete_prefix("packages/1/deeper")
+
+        assert _keys(local_client) == ["packages/1"]
+
+
+class FakeS3:
+    """Lists keys in 1000-key pages and records DeleteObjects calls"""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.deleted = []
+        self.prefixes = []
+        self._lock = threading.Lock()
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        fake = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                fake.prefixes.append(Prefix)
+                matching = [k for k in fake.keys if k.startswith(Prefix)]
+                if not matching:
+                    yield {}
+                for start in range(0, len(matching), 1000):
+                    yield {"Contents": [{"Key": k} for k in matching[start:start + 1000]]}
+
+        return Paginator()
+
+    def delete_objects(self, Bucket, Delete):
+        assert Delete["Quiet"] is True
+        assert len(Delete["Objects"]) <= 1000
+        with self._lock:
+            self.deleted.extend(obj["Key"] for obj in Delete["Objects"])
+
+
+class TestDeletePrefixS3:
+    def _client(self, monkeypatch, keys):
+        monkeypatch.setattr(s3_client, "S3_LOCAL_DIR", None)
+        fake = FakeS3(keys)
+        monkeypatch.setattr(s3_client.boto3, "client", lambda *args, **kwargs: fake)
+        return S3Client(), fake
+
+    def test_deletes_every_page_under_prefix(self, monkeypatch):
+        wanted = [f"packages/12/{n:04d}" for n in range(2503)]
+        client, fake = self._client(monkeypatch, wanted + ["packages/2/keep"])
+
+        client.delete_prefix("packages/12")
+
+        assert fake.prefixes == ["packages/12"]
+        assert sorted(fake.deleted) == wanted
+
+    def test_empty_listing_sends_no_deletes(self, monkeypatch):
+        client, fake = self._client(monkeypatch, ["packages/2/keep"])
+
+        client.delete_prefix("packages/12")
+
+        assert fake.deleted == []